@@ -8,31 +8,155 @@ Este sistema implementa un codificador matemáticamente transparente
 que trabaja a nivel de bits con bases y potencias restringidas.
 """
 
+import functools
 import hashlib
+import math
 import time
+from dataclasses import dataclass
 from typing import List, Tuple, Dict, Any
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_DISPONIBLE = True
+except ImportError:  # Numba es opcional: sin él se usa la ruta de CPython
+    njit = None
+    prange = range
+    _NUMBA_DISPONIBLE = False
+
 
 class ConfiguracionInvalidaError(Exception):
     """Excepción lanzada cuando se intenta usar una configuración inválida"""
     pass
 
 
+if _NUMBA_DISPONIBLE:
+    # Núcleos compilados para bloques de hasta 64 bits: toda la aritmética
+    # cabe en uint64, así que las firmas se fijan explícitamente para evitar
+    # promociones de tipo (uint64 con int64 promociona a float64 en NumPy)
+
+    @njit("uint64[:](uint64, uint64, uint64, int64)", cache=True)
+    def _codificar_b2_njit(valor, mascara, bits_ventana, n_ventanas):
+        ventanas = np.empty(n_ventanas, dtype=np.uint64)
+        for i in range(n_ventanas):
+            ventanas[i] = (valor >> (np.uint64(i) * bits_ventana)) & mascara
+        return ventanas
+
+    @njit("uint64(uint64[:], uint64)", cache=True)
+    def _decodificar_b2_njit(ventanas, bits_ventana):
+        valor = np.uint64(0)
+        for i in range(ventanas.shape[0]):
+            valor |= ventanas[i] << (np.uint64(i) * bits_ventana)
+        return valor
+
+    @njit("void(uint64[:], uint64, uint64, int64, uint64[:, :])",
+          cache=True, parallel=True)
+    def _codificar_b2_lote_njit(valores, mascara, bits_ventana, n_ventanas, salida):
+        # Cada bloque es independiente: prange reparte las filas entre núcleos
+        for i in prange(valores.shape[0]):
+            valor = valores[i]
+            for j in range(n_ventanas):
+                salida[i, j] = (valor >> (np.uint64(j) * bits_ventana)) & mascara
+
+
+@dataclass(slots=True, frozen=True)
+class DatosCodificados:
+    """
+    Resultado de una codificación: bloques codificados más sus metadatos.
+
+    Los campos se leen como atributos (acceso directo por slot, sin hash de
+    claves); __getitem__ se conserva para el código que todavía indexa el
+    resultado al estilo diccionario.
+    """
+    bloques_codificados: Any
+    bits_padding: int
+    base: int
+    potencia: int
+    bits_por_bloque: int
+    num_bloques: int
+    bits_originales: int
+    tiempo_codificacion: float
+    bloques_lens: Any = None
+
+    def __getitem__(self, clave: str) -> Any:
+        return getattr(self, clave)
+
+
+def _normalizar_bits(datos_binarios) -> str:
+    """
+    Normaliza un buffer de bits a la cadena '0'/'1' que usa el códec.
+
+    Acepta la cadena tradicional, bytes ASCII (b'0101...') o un arreglo
+    numpy uint8 de bits (como el que produce np.unpackbits), de modo que
+    los llamadores pueden trabajar con buffers compactos sin convertir a
+    str por su cuenta.
+    """
+    if isinstance(datos_binarios, str):
+        return datos_binarios
+    if isinstance(datos_binarios, (bytes, bytearray)):
+        return datos_binarios.decode('ascii')
+    if isinstance(datos_binarios, np.ndarray):
+        return (datos_binarios.astype(np.uint8) + ord('0')).tobytes().decode('ascii')
+    raise TypeError(
+        f"Tipo de datos binarios no soportado: {type(datos_binarios).__name__}"
+    )
+
+
+def _bits_a_empaquetado(datos_binarios: str) -> np.ndarray:
+    """
+    Empaqueta una cadena de bits ('0'/'1') en un buffer contiguo de bytes.
+
+    Convierte toda la cadena de una sola pasada vectorizada en lugar de
+    interpretar carácter por carácter con int(cadena, 2).
+
+    Args:
+        datos_binarios: Cadena de bits (solo '0' y '1')
+
+    Returns:
+        Arreglo numpy uint8 con los bits empaquetados (big-endian)
+    """
+    bits = np.frombuffer(datos_binarios.encode('ascii'), dtype=np.uint8) - ord('0')
+    return np.packbits(bits, bitorder='big')
+
+
 class CodificadorUniversal:
     """
     Codificador/Decodificador Universal con restricciones estrictas
     en bases, potencias y tamaños de bloque.
     """
     
-    # Definición estricta de potencias permitidas
-    POTENCIAS_BASE_2 = [2**1, 2**2, 2**4, 2**8, 2**16, 2**32, 2**64]
-    POTENCIAS_BASE_5 = [5**1, 5**2, 5**3, 5**4]  # 5, 25, 125, 625
+    # Definición estricta de potencias permitidas (frozenset: pertenencia O(1))
+    POTENCIAS_BASE_2 = frozenset([2**1, 2**2, 2**4, 2**8, 2**16, 2**32, 2**64])
+    POTENCIAS_BASE_5 = frozenset([5**1, 5**2, 5**3, 5**4])  # 5, 25, 125, 625
     
     # Rango de tamaño de bloque permitido
     BITS_MINIMO = 10
     BITS_MAXIMO = 1000
     
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def get(cls, base: int, potencia: int, bits_por_bloque: int,
+            verbose: bool = False) -> 'CodificadorUniversal':
+        """
+        Fábrica memoizada: devuelve una instancia ya validada y configurada.
+
+        Las instancias no mutan estado entre codificaciones, así que pueden
+        compartirse; las llamadas repetidas con los mismos parámetros evitan
+        revalidar y reconstruir las tablas precalculadas.
+
+        Args:
+            base: Base numérica (2 o 5 únicamente)
+            potencia: Potencia de la base (debe estar en las listas permitidas)
+            bits_por_bloque: Tamaño del bloque en bits (10-1000)
+            verbose: Si True, imprime información detallada del proceso
+
+        Returns:
+            Instancia compartida de CodificadorUniversal
+        """
+        return cls(base, potencia, bits_por_bloque, verbose)
+
     def __init__(self, base: int, potencia: int, bits_por_bloque: int, verbose: bool = True):
         """
         Inicializa el codificador con parámetros estrictos.
@@ -59,13 +183,13 @@ class CodificadorUniversal:
             if potencia not in self.POTENCIAS_BASE_2:
                 raise ConfiguracionInvalidaError(
                     f"Potencia {potencia} no permitida para base 2. "
-                    f"Potencias permitidas: {self.POTENCIAS_BASE_2}"
+                    f"Potencias permitidas: {sorted(self.POTENCIAS_BASE_2)}"
                 )
         elif base == 5:
             if potencia not in self.POTENCIAS_BASE_5:
                 raise ConfiguracionInvalidaError(
                     f"Potencia {potencia} no permitida para base 5. "
-                    f"Potencias permitidas: {self.POTENCIAS_BASE_5}"
+                    f"Potencias permitidas: {sorted(self.POTENCIAS_BASE_5)}"
                 )
         
         # Validación estricta de tamaño de bloque
@@ -78,7 +202,31 @@ class CodificadorUniversal:
         self.base = base
         self.potencia = potencia
         self.bits_por_bloque = bits_por_bloque
-        
+
+        # Bits sobrantes del último byte cuando el bloque no es múltiplo de 8
+        # (np.packbits rellena con ceros al final de cada fila)
+        self._desplazamiento_cola = (-bits_por_bloque) % 8
+
+        # Ruta JIT: disponible cuando el bloque completo cabe en uint64
+        self._ruta_numba = False
+
+        if base == 2:
+            # Parámetros de ventana fijos para toda la vida del codificador:
+            # ancho, máscara y el calendario completo de desplazamientos
+            self._bits_ventana = potencia.bit_length() - 1
+            self._mascara = potencia - 1
+            self._desplazamientos = tuple(range(0, bits_por_bloque, self._bits_ventana))
+            self._n_ventanas = len(self._desplazamientos)
+            self._ruta_numba = _NUMBA_DISPONIBLE and bits_por_bloque <= 64
+        elif base == 5:
+            # Tabla de potencias precalculada hasta el máximo de residuos por
+            # bloque: evita recomputar potencia ** idx en cada decodificación
+            max_residuos = math.ceil(bits_por_bloque / math.log2(potencia)) + 1
+            self._tabla_potencias = [potencia ** i for i in range(max_residuos)]
+            # Cuadrado precalculado: permite extraer dos residuos por cada
+            # división grande en el codificador
+            self._potencia_cuadrada = potencia * potencia
+
         if self.verbose:
             print(f"\n{'='*70}")
             print(f"CODIFICADOR UNIVERSAL INICIALIZADO")
@@ -99,27 +247,152 @@ class CodificadorUniversal:
         Returns:
             Tupla (lista_de_bloques, bits_de_padding_añadidos)
         """
-        bloques = []
-        bits_padding = 0
-        
-        # Segmentar en bloques
-        for i in range(0, len(datos_binarios), self.bits_por_bloque):
-            bloque = datos_binarios[i:i + self.bits_por_bloque]
-            
-            # Aplicar padding si el último bloque es incompleto
-            if len(bloque) < self.bits_por_bloque:
-                bits_padding = self.bits_por_bloque - len(bloque)
-                bloque = bloque + '0' * bits_padding
-                
-                if self.verbose:
-                    print(f"\n⚠️  PADDING APLICADO:")
-                    print(f"   Bloque incompleto con {len(datos_binarios[i:])} bits")
-                    print(f"   Se añadieron {bits_padding} ceros de padding")
-            
-            bloques.append(bloque)
-        
+        B = self.bits_por_bloque
+
+        # Aplicar padding una sola vez sobre la cadena completa
+        bits_padding = (-len(datos_binarios)) % B
+        if bits_padding:
+            if self.verbose:
+                print(f"\n⚠️  PADDING APLICADO:")
+                print(f"   Bloque incompleto con {B - bits_padding} bits")
+                print(f"   Se añadieron {bits_padding} ceros de padding")
+
+            datos_binarios = datos_binarios + '0' * bits_padding
+
+        # Segmentar en bloques de tamaño exacto
+        bloques = [datos_binarios[i:i + B] for i in range(0, len(datos_binarios), B)]
+
         return bloques, bits_padding
-    
+
+    def _binario_a_bloques_empaquetados(self, datos_binarios: str) -> Tuple[np.ndarray, int]:
+        """
+        Segmenta una cadena binaria en bloques empaquetados como bytes.
+
+        Parsea la cadena completa una sola vez (pasada vectorizada) y devuelve
+        una matriz donde cada fila contiene los bytes de un bloque.
+
+        Args:
+            datos_binarios: Cadena de bits (solo '0' y '1')
+
+        Returns:
+            Tupla (matriz de forma (n_bloques, bytes_por_bloque), bits_de_padding)
+        """
+        bits = np.frombuffer(datos_binarios.encode('ascii'), dtype=np.uint8) - ord('0')
+        bits_padding = (-bits.size) % self.bits_por_bloque
+        if bits_padding:
+            bits = np.concatenate([bits, np.zeros(bits_padding, dtype=np.uint8)])
+
+        n_bloques = bits.size // self.bits_por_bloque
+        filas = np.packbits(bits.reshape(n_bloques, self.bits_por_bloque),
+                            axis=1, bitorder='big')
+        return filas, bits_padding
+
+    def _valor_de_bloque(self, fila: np.ndarray) -> int:
+        """Convierte la fila de bytes de un bloque a su valor entero."""
+        return int.from_bytes(fila.tobytes(), 'big') >> self._desplazamiento_cola
+
+    def _int_a_cadena_bits(self, valor: int) -> str:
+        """
+        Convierte un valor reconstruido a su cadena de bits_por_bloque bits.
+
+        Serializa el entero a bytes y desempaqueta los bits de forma
+        vectorizada, en lugar de pasar por bin() y zfill(). El valor cero
+        produce la cadena de ceros sin caso especial.
+        """
+        n_bytes = (self.bits_por_bloque + 7) // 8
+        octetos = np.frombuffer(valor.to_bytes(n_bytes, 'big'), dtype=np.uint8)
+        bits = np.unpackbits(octetos, bitorder='big')[-self.bits_por_bloque:]
+        return (bits + ord('0')).astype(np.uint8).tobytes().decode('ascii')
+
+    def _codificar_valor_base2(self, valor_decimal: int) -> List[int]:
+        """
+        Extrae las ventanas binarias de un valor ya convertido a entero.
+
+        Devuelve siempre las _n_ventanas del bloque completo: las ventanas
+        superiores en cero se conservan (la reconstrucción las absorbe sin
+        costo y así la lista tiene tamaño fijo, sin recortes ni casos
+        especiales para el bloque nulo).
+        """
+        if self._ruta_numba:
+            return _codificar_b2_njit(
+                valor_decimal, self._mascara, self._bits_ventana, self._n_ventanas
+            ).tolist()
+
+        mascara = self._mascara
+        return [(valor_decimal >> d) & mascara for d in self._desplazamientos]
+
+    def _codificar_valor_base5(self, valor_decimal: int) -> List[int]:
+        """Obtiene los residuos base 5 de un valor ya convertido a entero."""
+        # divmod obtiene cociente y residuo en una sola división; la potencia
+        # y el append se llevan a locales para evitar búsquedas por iteración
+        P = self.potencia
+        P2 = self._potencia_cuadrada
+        residuos = []
+        agregar = residuos.append
+        cociente = valor_decimal
+
+        # Dividir por P² extrae dos residuos por división grande: la mitad de
+        # divisiones sobre el entero largo; separar el resto (< P²) es barato
+        while cociente >= P2:
+            cociente, resto = divmod(cociente, P2)
+            alto, bajo = divmod(resto, P)
+            agregar(bajo)
+            agregar(alto)
+
+        while cociente:
+            cociente, residuo = divmod(cociente, P)
+            agregar(residuo)
+
+        if not residuos:  # Valor es cero
+            residuos = [0]
+
+        return residuos
+
+    def codificar_base2_lote(self, datos_binarios: str) -> Tuple[np.ndarray, int]:
+        """
+        Codifica todos los bloques de una cadena binaria de una sola vez.
+
+        Todos los bloques comparten el mismo calendario de desplazamientos y
+        la misma máscara, así que la extracción de ventanas se aplica a la
+        matriz completa con un único kernel de NumPy en lugar de iterar
+        bloque a bloque en Python.
+
+        Args:
+            datos_binarios: Cadena de bits a codificar
+
+        Returns:
+            Tupla (matriz de ventanas de forma (n_bloques, n_ventanas),
+            bits_de_padding). Las ventanas superiores en cero se conservan.
+        """
+        filas, bits_padding = self._binario_a_bloques_empaquetados(datos_binarios)
+
+        if self.bits_por_bloque <= 64:
+            # Los bloques caben en uint64: alinear las filas a 8 bytes y
+            # aplicar desplazamiento y máscara a todos los bloques a la vez
+            alineadas = np.zeros((filas.shape[0], 8), dtype=np.uint8)
+            alineadas[:, 8 - filas.shape[1]:] = filas
+            valores = (alineadas.view('>u8')[:, 0]
+                       >> np.uint64(self._desplazamiento_cola)).astype(np.uint64)
+
+            if self._ruta_numba:
+                # Núcleo compilado con prange: reparte los bloques entre núcleos
+                ventanas = np.empty((valores.shape[0], self._n_ventanas), dtype=np.uint64)
+                _codificar_b2_lote_njit(valores, self._mascara, self._bits_ventana,
+                                        self._n_ventanas, ventanas)
+            else:
+                desplazamientos = np.array(self._desplazamientos, dtype=np.uint64)
+                ventanas = (valores[:, None] >> desplazamientos[None, :]) & np.uint64(self._mascara)
+        else:
+            # Bloques mayores de 64 bits: enteros de Python por fila, pero
+            # con el calendario de desplazamientos ya precalculado
+            mascara = self._mascara
+            ventanas = np.empty((len(filas), len(self._desplazamientos)), dtype=np.uint64)
+            for i, fila in enumerate(filas):
+                valor = self._valor_de_bloque(fila)
+                ventanas[i] = [(valor >> d) & mascara for d in self._desplazamientos]
+
+        return ventanas, bits_padding
+
     def codificar_bloque_base2(self, bloque_binario: str, numero_bloque: int) -> List[int]:
         """
         Codifica un bloque usando desplazamientos binarios y máscaras.
@@ -131,48 +404,50 @@ class CodificadorUniversal:
         Returns:
             Lista de valores codificados (ventanas binarias)
         """
+        if not self.verbose:
+            return self._codificar_valor_base2(int(bloque_binario, 2))
+        return self._codificar_b2_traza(bloque_binario, numero_bloque)
+
+    def _codificar_b2_traza(self, bloque_binario: str, numero_bloque: int) -> List[int]:
+        """Variante con traza de codificar_bloque_base2: imprime cada paso."""
         # Paso 1: Conversión a decimal
         valor_decimal = int(bloque_binario, 2)
-        
-        if self.verbose:
-            print(f"\n{'─'*70}")
-            print(f"CODIFICACIÓN BLOQUE #{numero_bloque} (BASE 2)")
-            print(f"{'─'*70}")
-            print(f"Bloque binario original ({len(bloque_binario)} bits):")
-            print(f"  {bloque_binario}")
-            print(f"\nPaso 1 - Conversión a decimal:")
-            print(f"  Valor decimal: {valor_decimal}")
-        
+
+        print(f"\n{'─'*70}")
+        print(f"CODIFICACIÓN BLOQUE #{numero_bloque} (BASE 2)")
+        print(f"{'─'*70}")
+        print(f"Bloque binario original ({len(bloque_binario)} bits):")
+        print(f"  {bloque_binario}")
+        print(f"\nPaso 1 - Conversión a decimal:")
+        print(f"  Valor decimal: {valor_decimal}")
+
         # Paso 2: Aplicar desplazamientos y máscaras
         ventanas = []
-        bits_ventana = self.potencia.bit_length() - 1  # Ancho de la ventana
-        mascara = self.potencia - 1  # Máscara para extraer bits
-        
+        bits_ventana = self._bits_ventana  # Ancho de la ventana
+        mascara = self._mascara  # Máscara para extraer bits
+
         valor_actual = valor_decimal
         posicion = 0
-        
-        if self.verbose:
-            print(f"\nPaso 2 - Desplazamientos binarios:")
-            print(f"  Ancho de ventana: {bits_ventana} bits")
-            print(f"  Máscara: {bin(mascara)} ({mascara})")
-            print(f"\n  Proceso de extracción:")
-        
+
+        print(f"\nPaso 2 - Desplazamientos binarios:")
+        print(f"  Ancho de ventana: {bits_ventana} bits")
+        print(f"  Máscara: {bin(mascara)} ({mascara})")
+        print(f"\n  Proceso de extracción:")
+
         while valor_actual > 0:
             ventana = valor_actual & mascara
             ventanas.append(ventana)
-            
-            if self.verbose:
-                print(f"    Posición {posicion}: {valor_actual} & {mascara} = {ventana}")
-            
+
+            print(f"    Posición {posicion}: {valor_actual} & {mascara} = {ventana}")
+
             valor_actual >>= bits_ventana
             posicion += 1
-        
+
         if not ventanas:  # Bloque completamente de ceros
             ventanas = [0]
-        
-        if self.verbose:
-            print(f"\n  Valores de ventanas extraídos: {ventanas}")
-        
+
+        print(f"\n  Valores de ventanas extraídos: {ventanas}")
+
         return ventanas
     
     def codificar_bloque_base5(self, bloque_binario: str, numero_bloque: int) -> List[int]:
@@ -186,63 +461,99 @@ class CodificadorUniversal:
         Returns:
             Lista de residuos (representación en base 5)
         """
+        if not self.verbose:
+            return self._codificar_valor_base5(int(bloque_binario, 2))
+        return self._codificar_b5_traza(bloque_binario, numero_bloque)
+
+    def _codificar_b5_traza(self, bloque_binario: str, numero_bloque: int) -> List[int]:
+        """Variante con traza de codificar_bloque_base5: imprime cada paso."""
         # Paso 1: Conversión a decimal
         valor_decimal = int(bloque_binario, 2)
-        
-        if self.verbose:
-            print(f"\n{'─'*70}")
-            print(f"CODIFICACIÓN BLOQUE #{numero_bloque} (BASE 5)")
-            print(f"{'─'*70}")
-            print(f"Bloque binario original ({len(bloque_binario)} bits):")
-            print(f"  {bloque_binario}")
-            print(f"\nPaso 1 - Conversión a decimal:")
-            print(f"  Valor decimal: {valor_decimal}")
-        
+
+        print(f"\n{'─'*70}")
+        print(f"CODIFICACIÓN BLOQUE #{numero_bloque} (BASE 5)")
+        print(f"{'─'*70}")
+        print(f"Bloque binario original ({len(bloque_binario)} bits):")
+        print(f"  {bloque_binario}")
+        print(f"\nPaso 1 - Conversión a decimal:")
+        print(f"  Valor decimal: {valor_decimal}")
+
         # Paso 2: Divisiones sucesivas
         residuos = []
         cociente = valor_decimal
         iteracion = 0
-        
-        if self.verbose:
-            print(f"\nPaso 2 - Divisiones sucesivas por {self.potencia}:")
-            print(f"  {'Iteración':<10} {'Cociente':<20} {'÷ {self.potencia}':<15} {'= Q':<20} {'R':<10}")
-            print(f"  {'-'*75}")
-        
+
+        print(f"\nPaso 2 - Divisiones sucesivas por {self.potencia}:")
+        print(f"  {'Iteración':<10} {'Cociente':<20} {'÷ {self.potencia}':<15} {'= Q':<20} {'R':<10}")
+        print(f"  {'-'*75}")
+
         while cociente > 0:
             residuo = cociente % self.potencia
             cociente = cociente // self.potencia
             residuos.append(residuo)
-            
-            if self.verbose:
-                print(f"  {iteracion:<10} {cociente * self.potencia + residuo:<20} "
-                      f"{'÷ ' + str(self.potencia):<15} {cociente:<20} {residuo:<10}")
-            
+
+            print(f"  {iteracion:<10} {cociente * self.potencia + residuo:<20} "
+                  f"{'÷ ' + str(self.potencia):<15} {cociente:<20} {residuo:<10}")
+
             iteracion += 1
-        
+
         if not residuos:  # Valor es cero
             residuos = [0]
-        
-        if self.verbose:
-            print(f"\n  Residuos obtenidos: {residuos}")
-        
+
+        print(f"\n  Residuos obtenidos: {residuos}")
+
         return residuos
     
-    def codificar(self, datos_binarios: str) -> Dict[str, Any]:
+    def codificar(self, datos_binarios: str) -> DatosCodificados:
         """
         Codifica una cadena binaria completa.
-        
+
         Args:
-            datos_binarios: Cadena de bits a codificar
-        
+            datos_binarios: Cadena de bits a codificar; también se aceptan
+                bytes ASCII o un arreglo numpy uint8 de bits
+
         Returns:
-            Diccionario con datos codificados y metadatos
+            DatosCodificados con los bloques codificados y sus metadatos
         """
+        datos_binarios = _normalizar_bits(datos_binarios)
+
         inicio = time.time()
-        
-        # Segmentar en bloques
-        bloques, bits_padding = self.binario_a_bloques(datos_binarios)
-        
-        if self.verbose:
+
+        if not self.verbose:
+            # Ruta rápida: una sola pasada vectorizada sobre la cadena completa
+            # en lugar de convertir bloque a bloque con int(cadena, 2)
+            if self.base == 2:
+                matriz, bits_padding = self.codificar_base2_lote(datos_binarios)
+                num_bloques = len(matriz)
+
+                if self.potencia <= (1 << 32):
+                    # Forma compacta: matriz uint32 contigua más un vector de
+                    # longitudes útiles por bloque (ventanas sin los ceros
+                    # superiores), en vez de una lista de listas de enteros
+                    bloques_codificados = matriz.astype(np.uint32)
+
+                    no_nulas = bloques_codificados != 0
+                    ultimas = matriz.shape[1] - np.argmax(no_nulas[:, ::-1], axis=1)
+                    bloques_lens = np.where(no_nulas.any(axis=1), ultimas, 1).astype(np.int32)
+                else:
+                    # Listas de tamaño fijo: las ventanas superiores en cero
+                    # se conservan, igual que en _codificar_valor_base2
+                    bloques_codificados = matriz.tolist()
+                    bloques_lens = None
+            else:  # base == 5
+                filas, bits_padding = self._binario_a_bloques_empaquetados(datos_binarios)
+                num_bloques = len(filas)
+
+                bloques_codificados = [
+                    self._codificar_valor_base5(self._valor_de_bloque(fila))
+                    for fila in filas
+                ]
+                bloques_lens = None
+        else:
+            # Segmentar en bloques
+            bloques, bits_padding = self.binario_a_bloques(datos_binarios)
+            num_bloques = len(bloques)
+
             print(f"\n{'='*70}")
             print(f"INICIO DE CODIFICACIÓN")
             print(f"{'='*70}")
@@ -250,30 +561,33 @@ class CodificadorUniversal:
             print(f"Número de bloques: {len(bloques)}")
             print(f"Bits de padding: {bits_padding}")
             print(f"{'='*70}")
-        
-        # Codificar cada bloque
-        bloques_codificados = []
-        
-        for idx, bloque in enumerate(bloques, 1):
-            if self.base == 2:
-                valores = self.codificar_bloque_base2(bloque, idx)
-            else:  # base == 5
-                valores = self.codificar_bloque_base5(bloque, idx)
-            
-            bloques_codificados.append(valores)
-        
+
+            # Codificar cada bloque
+            bloques_codificados = []
+
+            for idx, bloque in enumerate(bloques, 1):
+                if self.base == 2:
+                    valores = self.codificar_bloque_base2(bloque, idx)
+                else:  # base == 5
+                    valores = self.codificar_bloque_base5(bloque, idx)
+
+                bloques_codificados.append(valores)
+
+            bloques_lens = None
+
         tiempo_codificacion = time.time() - inicio
-        
-        resultado = {
-            'bloques_codificados': bloques_codificados,
-            'bits_padding': bits_padding,
-            'base': self.base,
-            'potencia': self.potencia,
-            'bits_por_bloque': self.bits_por_bloque,
-            'num_bloques': len(bloques),
-            'bits_originales': len(datos_binarios),
-            'tiempo_codificacion': tiempo_codificacion
-        }
+
+        resultado = DatosCodificados(
+            bloques_codificados=bloques_codificados,
+            bloques_lens=bloques_lens,
+            bits_padding=bits_padding,
+            base=self.base,
+            potencia=self.potencia,
+            bits_por_bloque=self.bits_por_bloque,
+            num_bloques=num_bloques,
+            bits_originales=len(datos_binarios),
+            tiempo_codificacion=tiempo_codificacion
+        )
         
         if self.verbose:
             print(f"\n{'='*70}")
@@ -295,37 +609,58 @@ class CodificadorUniversal:
         Returns:
             Cadena binaria reconstruida
         """
-        if self.verbose:
-            print(f"\n{'─'*70}")
-            print(f"DECODIFICACIÓN BLOQUE #{numero_bloque} (BASE 2)")
-            print(f"{'─'*70}")
-            print(f"Valores codificados: {valores}")
-        
+        if not self.verbose:
+            return self._decodificar_b2_rapido(valores)
+        return self._decodificar_b2_traza(valores, numero_bloque)
+
+    def _decodificar_b2_rapido(self, valores: List[int]) -> str:
+        """Variante rápida de decodificar_bloque_base2: solo aritmética."""
+        if self._ruta_numba:
+            valor_reconstruido = int(_decodificar_b2_njit(
+                np.asarray(valores, dtype=np.uint64), self._bits_ventana
+            ))
+        else:
+            bits_ventana = self._bits_ventana
+            valor_reconstruido = 0
+            for idx, ventana in enumerate(valores):
+                valor_reconstruido |= (ventana << (idx * bits_ventana))
+
+        return self._int_a_cadena_bits(valor_reconstruido)
+
+    def _decodificar_b2_traza(self, valores: List[int], numero_bloque: int) -> str:
+        """Variante con traza de decodificar_bloque_base2: imprime cada paso."""
+        print(f"\n{'─'*70}")
+        print(f"DECODIFICACIÓN BLOQUE #{numero_bloque} (BASE 2)")
+        print(f"{'─'*70}")
+        print(f"Valores codificados: {valores}")
+
         # Reconstruir el valor decimal
-        bits_ventana = self.potencia.bit_length() - 1
+        bits_ventana = self._bits_ventana
         valor_reconstruido = 0
-        
-        if self.verbose:
-            print(f"\nReconstrucción mediante desplazamientos:")
-            print(f"  Ancho de ventana: {bits_ventana} bits")
-        
+
+        print(f"\nReconstrucción mediante desplazamientos:")
+        print(f"  Ancho de ventana: {bits_ventana} bits")
+
         for idx, ventana in enumerate(valores):
             valor_reconstruido |= (ventana << (idx * bits_ventana))
-            
-            if self.verbose:
-                print(f"  Posición {idx}: valor |= ({ventana} << {idx * bits_ventana})")
-        
+
+        # Emitir la tabla completa con una sola escritura, fuera del bucle
+        # numérico: una llamada a print en lugar de una por posición
+        print('\n'.join(
+            f"  Posición {idx}: valor |= ({ventana} << {idx * bits_ventana})"
+            for idx, ventana in enumerate(valores)
+        ))
+
         # Convertir a binario
         if valor_reconstruido == 0:
             bloque_binario = '0' * self.bits_por_bloque
         else:
             bloque_binario = bin(valor_reconstruido)[2:].zfill(self.bits_por_bloque)
-        
-        if self.verbose:
-            print(f"\nValor decimal reconstruido: {valor_reconstruido}")
-            print(f"Bloque binario reconstruido ({len(bloque_binario)} bits):")
-            print(f"  {bloque_binario}")
-        
+
+        print(f"\nValor decimal reconstruido: {valor_reconstruido}")
+        print(f"Bloque binario reconstruido ({len(bloque_binario)} bits):")
+        print(f"  {bloque_binario}")
+
         return bloque_binario
     
     def decodificar_bloque_base5(self, residuos: List[int], numero_bloque: int) -> str:
@@ -339,87 +674,113 @@ class CodificadorUniversal:
         Returns:
             Cadena binaria reconstruida
         """
-        if self.verbose:
-            print(f"\n{'─'*70}")
-            print(f"DECODIFICACIÓN BLOQUE #{numero_bloque} (BASE 5)")
-            print(f"{'─'*70}")
-            print(f"Residuos codificados: {residuos}")
-        
+        if not self.verbose:
+            return self._decodificar_b5_rapido(residuos)
+        return self._decodificar_b5_traza(residuos, numero_bloque)
+
+    def _decodificar_b5_rapido(self, residuos: List[int]) -> str:
+        """Variante rápida de decodificar_bloque_base5: solo aritmética."""
+        # Reconstruir el valor decimal con el esquema de Horner: O(n)
+        # multiplicaciones en lugar de una exponenciación por residuo
+        valor_reconstruido = 0
+        P = self.potencia
+        for residuo in reversed(residuos):
+            valor_reconstruido = valor_reconstruido * P + residuo
+
+        return self._int_a_cadena_bits(valor_reconstruido)
+
+    def _decodificar_b5_traza(self, residuos: List[int], numero_bloque: int) -> str:
+        """Variante con traza de decodificar_bloque_base5: imprime cada paso."""
+        print(f"\n{'─'*70}")
+        print(f"DECODIFICACIÓN BLOQUE #{numero_bloque} (BASE 5)")
+        print(f"{'─'*70}")
+        print(f"Residuos codificados: {residuos}")
+
         # Reconstruir el valor decimal
         valor_reconstruido = 0
-        
-        if self.verbose:
-            print(f"\nReconstrucción desde residuos:")
-        
+
+        print(f"\nReconstrucción desde residuos:")
+
+        tabla = self._tabla_potencias
+        lineas = []
         for idx, residuo in enumerate(residuos):
-            contribucion = residuo * (self.potencia ** idx)
+            contribucion = residuo * tabla[idx]
             valor_reconstruido += contribucion
-            
-            if self.verbose:
-                print(f"  Posición {idx}: {residuo} × {self.potencia}^{idx} = {contribucion}")
-        
+
+            lineas.append(f"  Posición {idx}: {residuo} × {self.potencia}^{idx} = {contribucion}")
+
+        # Una sola escritura para toda la tabla en lugar de un print por fila
+        print('\n'.join(lineas))
+
         # Convertir a binario
         if valor_reconstruido == 0:
             bloque_binario = '0' * self.bits_por_bloque
         else:
             bloque_binario = bin(valor_reconstruido)[2:].zfill(self.bits_por_bloque)
-        
-        if self.verbose:
-            print(f"\nValor decimal reconstruido: {valor_reconstruido}")
-            print(f"Bloque binario reconstruido ({len(bloque_binario)} bits):")
-            print(f"  {bloque_binario}")
-        
+
+        print(f"\nValor decimal reconstruido: {valor_reconstruido}")
+        print(f"Bloque binario reconstruido ({len(bloque_binario)} bits):")
+        print(f"  {bloque_binario}")
+
         return bloque_binario
     
-    def decodificar(self, datos_codificados: Dict[str, Any]) -> str:
+    def decodificar(self, datos_codificados: DatosCodificados) -> str:
         """
         Decodifica datos previamente codificados.
-        
+
         Args:
-            datos_codificados: Diccionario con datos codificados y metadatos
-        
+            datos_codificados: DatosCodificados devuelto por codificar
+
         Returns:
             Cadena binaria original reconstruida
         """
         inicio = time.time()
-        
+
         # Validar que los parámetros coincidan
-        if datos_codificados['base'] != self.base:
+        if datos_codificados.base != self.base:
             raise ValueError("La base no coincide con la configuración del codificador")
-        if datos_codificados['potencia'] != self.potencia:
+        if datos_codificados.potencia != self.potencia:
             raise ValueError("La potencia no coincide con la configuración del codificador")
-        if datos_codificados['bits_por_bloque'] != self.bits_por_bloque:
+        if datos_codificados.bits_por_bloque != self.bits_por_bloque:
             raise ValueError("El tamaño de bloque no coincide con la configuración")
-        
+
         if self.verbose:
             print(f"\n{'='*70}")
             print(f"INICIO DE DECODIFICACIÓN")
             print(f"{'='*70}")
-            print(f"Número de bloques: {datos_codificados['num_bloques']}")
-            print(f"Bits de padding a eliminar: {datos_codificados['bits_padding']}")
+            print(f"Número de bloques: {datos_codificados.num_bloques}")
+            print(f"Bits de padding a eliminar: {datos_codificados.bits_padding}")
             print(f"{'='*70}")
         
-        # Decodificar cada bloque
+        # Decodificar cada bloque, resolviendo el despacho una sola vez
+        if self.base == 2:
+            decodificar_bloque = self.decodificar_bloque_base2
+        else:  # base == 5
+            decodificar_bloque = self.decodificar_bloque_base5
+
         bloques_decodificados = []
-        
-        for idx, valores in enumerate(datos_codificados['bloques_codificados'], 1):
-            if self.base == 2:
-                bloque = self.decodificar_bloque_base2(valores, idx)
-            else:  # base == 5
-                bloque = self.decodificar_bloque_base5(valores, idx)
-            
-            bloques_decodificados.append(bloque)
+
+        bloques = datos_codificados.bloques_codificados
+        if isinstance(bloques, np.ndarray):
+            # Forma compacta (matriz + longitudes): recuperar la lista de
+            # ventanas útiles de cada fila
+            matriz = bloques
+            lens = datos_codificados.bloques_lens
+            bloques = (matriz[i, :lens[i]].tolist() for i in range(len(matriz)))
+
+        for idx, valores in enumerate(bloques, 1):
+            bloques_decodificados.append(decodificar_bloque(valores, idx))
         
         # Unir todos los bloques
         datos_reconstruidos = ''.join(bloques_decodificados)
         
         # Eliminar padding del último bloque
-        if datos_codificados['bits_padding'] > 0:
-            datos_reconstruidos = datos_reconstruidos[:-datos_codificados['bits_padding']]
-            
+        if datos_codificados.bits_padding > 0:
+            datos_reconstruidos = datos_reconstruidos[:-datos_codificados.bits_padding]
+
             if self.verbose:
                 print(f"\n⚠️  ELIMINACIÓN DE PADDING:")
-                print(f"   Se eliminaron {datos_codificados['bits_padding']} bits de padding")
+                print(f"   Se eliminaron {datos_codificados.bits_padding} bits de padding")
         
         tiempo_decodificacion = time.time() - inicio
         
@@ -451,14 +812,17 @@ class AnalizadorEficiencia:
         Returns:
             Hash SHA-256 en hexadecimal
         """
-        # Convertir la cadena binaria a bytes
-        # Asegurar que la longitud sea múltiplo de 8
-        padding_bytes = (8 - len(datos_binarios) % 8) % 8
-        datos_padded = datos_binarios + '0' * padding_bytes
-        
-        bytes_data = int(datos_padded, 2).to_bytes(len(datos_padded) // 8, byteorder='big')
-        
-        return hashlib.sha256(bytes_data).hexdigest()
+        # Hashear por tramos en lugar de materializar todo el payload como
+        # bytes: la memoria pico queda acotada por el tamaño del tramo.
+        # El tramo es múltiplo de 8 bits, así que solo el último sufre el
+        # relleno de np.packbits (igual que el padding global)
+        TRAMO_BITS = 1 << 19  # 64 KiB de bytes por tramo
+
+        h = hashlib.sha256()
+        for i in range(0, len(datos_binarios), TRAMO_BITS):
+            h.update(_bits_a_empaquetado(datos_binarios[i:i + TRAMO_BITS]).tobytes())
+
+        return h.hexdigest()
     
     @staticmethod
     def verificar_integridad(original: str, decodificado: str) -> bool:
@@ -511,14 +875,14 @@ class AnalizadorEficiencia:
         return integridad_ok
     
     @staticmethod
-    def calcular_metricas(datos_originales: str, datos_codificados: Dict[str, Any]) -> Dict[str, Any]:
+    def calcular_metricas(datos_originales: str, datos_codificados: DatosCodificados) -> Dict[str, Any]:
         """
         Calcula métricas de eficiencia del proceso.
-        
+
         Args:
             datos_originales: Cadena binaria original
-            datos_codificados: Diccionario con datos codificados
-        
+            datos_codificados: DatosCodificados devuelto por codificar
+
         Returns:
             Diccionario con métricas calculadas
         """
@@ -526,12 +890,23 @@ class AnalizadorEficiencia:
         print(f"ANÁLISIS DE EFICIENCIA")
         print(f"{'='*70}")
         
-        # Calcular tamaño codificado (suma de todos los valores)
-        total_valores = sum(len(bloque) for bloque in datos_codificados['bloques_codificados'])
-        bits_por_valor = max(max(v.bit_length() for v in bloque) 
-                            for bloque in datos_codificados['bloques_codificados'] 
-                            if bloque)
-        
+        # Calcular tamaño codificado (suma de todos los valores) y el ancho
+        # máximo en una sola pasada sobre los bloques
+        bloques = datos_codificados.bloques_codificados
+        if isinstance(bloques, np.ndarray):
+            # Forma compacta: reducciones vectorizadas sobre la matriz
+            total_valores = int(datos_codificados.bloques_lens.sum())
+            bits_por_valor = int(bloques.max()).bit_length() if bloques.size else 0
+        else:
+            total_valores = 0
+            bits_por_valor = 0
+            for bloque in bloques:
+                total_valores += len(bloque)
+                for v in bloque:
+                    b = v.bit_length()
+                    if b > bits_por_valor:
+                        bits_por_valor = b
+
         bits_codificados = total_valores * bits_por_valor
         
         # Tasa de expansión
@@ -540,14 +915,14 @@ class AnalizadorEficiencia:
         print(f"Bits originales: {len(datos_originales)}")
         print(f"Bits codificados (estimado): {bits_codificados}")
         print(f"Tasa de expansión: {tasa_expansion:.4f}")
-        print(f"Tiempo de codificación: {datos_codificados['tiempo_codificacion']:.6f} seg")
+        print(f"Tiempo de codificación: {datos_codificados.tiempo_codificacion:.6f} seg")
         
         metricas = {
             'bits_originales': len(datos_originales),
             'bits_codificados': bits_codificados,
             'tasa_expansion': tasa_expansion,
-            'tiempo_codificacion': datos_codificados['tiempo_codificacion'],
-            'num_bloques': datos_codificados['num_bloques']
+            'tiempo_codificacion': datos_codificados.tiempo_codificacion,
+            'num_bloques': datos_codificados.num_bloques
         }
         
         print(f"{'='*70}\n")
@@ -565,7 +940,9 @@ def bytes_a_binario(datos_bytes: bytes) -> str:
     Returns:
         Cadena de bits
     """
-    return ''.join(format(byte, '08b') for byte in datos_bytes)
+    # Un solo desempaquetado vectorizado en lugar de un format() por byte
+    bits = np.unpackbits(np.frombuffer(datos_bytes, dtype=np.uint8), bitorder='big')
+    return (bits + ord('0')).astype(np.uint8).tobytes().decode('ascii')
 
 
 def binario_a_bytes(datos_binarios: str) -> bytes:
@@ -578,11 +955,9 @@ def binario_a_bytes(datos_binarios: str) -> bytes:
     Returns:
         Datos en formato bytes
     """
-    # Asegurar que la longitud sea múltiplo de 8
-    padding = (8 - len(datos_binarios) % 8) % 8
-    datos_padded = datos_binarios + '0' * padding
-    
-    return int(datos_padded, 2).to_bytes(len(datos_padded) // 8, byteorder='big')
+    # np.packbits rellena con ceros hasta el múltiplo de 8, igual que el
+    # padding manual, pero sin pasar por un entero gigante intermedio
+    return _bits_a_empaquetado(datos_binarios).tobytes()
 
 
 def demostrar_sistema():
@@ -5,6 +5,12 @@ Ejemplos Específicos de Uso del Codificador Universal
 Demuestra casos de uso prácticos y escenarios comunes
 """
 
+import sys
+import time
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 from codificador_universal import (
     CodificadorUniversal,
     AnalizadorEficiencia,
@@ -13,6 +19,26 @@ from codificador_universal import (
     ConfiguracionInvalidaError
 )
 
+# 'spawn' en lugar de 'fork': el proceso padre ya arrancó los hilos de numba
+# y bifurcarlo después puede dejar a los trabajadores bloqueados
+_CONTEXTO = multiprocessing.get_context('spawn')
+
+# Plantillas de fila precompiladas: la especificación de formato se analiza
+# una sola vez en lugar de reconstruirse en cada iteración de las tablas
+_FILA_CONFIG = "{:<30} {:<10} {:<12.6f} {:<12.6f} {:<5}".format
+_FILA_POTENCIA = "{}^{:<22} {:<25} {:<10} {:<12}".format
+_FILA_EXPANSION = "{:<20} {:<8} {:<12} {:<12.4f} {:<15.2f}%".format
+
+# Textos de prueba codificados una sola vez a nivel de módulo; los puramente
+# ASCII usan .encode('ascii') (sin despacho de códec utf-8 por llamada) y
+# los que llevan tildes se quedan en utf-8
+_TEXTO_SIMPLE = "Python es poderoso!"
+_TEXTO_SIMPLE_BYTES = _TEXTO_SIMPLE.encode('ascii')
+_TEXTO_COMPARACION_BYTES = ("Análisis comparativo de sistemas de codificación reversible. " * 5).encode('utf-8')
+_TEXTO_POTENCIAS_BYTES = "Test de potencias".encode('ascii')
+_TEXTO_ABC = "ABC"
+_TEXTO_ABC_BYTES = _TEXTO_ABC.encode('ascii')
+
 
 def ejemplo_1_texto_simple():
     """Ejemplo 1: Codificar texto simple con Base 5"""
@@ -20,11 +46,11 @@ def ejemplo_1_texto_simple():
     print("EJEMPLO 1: Codificación de Texto Simple con Base 5")
     print("="*80)
     
-    texto = "Python es poderoso!"
+    texto = _TEXTO_SIMPLE
     print(f"\nTexto original: '{texto}'")
-    
+
     # Convertir a binario
-    datos_bytes = texto.encode('utf-8')
+    datos_bytes = _TEXTO_SIMPLE_BYTES
     datos_binarios = bytes_a_binario(datos_bytes)
     
     print(f"Tamaño: {len(datos_bytes)} bytes = {len(datos_binarios)} bits")
@@ -66,6 +92,33 @@ def ejemplo_1_texto_simple():
     integridad = AnalizadorEficiencia.verificar_integridad(datos_binarios, datos_decodificados)
 
 
+def _comparar_configuracion(args):
+    """
+    Trabajador serializable para la comparación de bases en paralelo.
+
+    Args:
+        args: Tupla (base, potencia, bits_por_bloque, datos_bytes)
+
+    Returns:
+        Tupla (num_bloques, tiempo_cod, tiempo_dec, ok)
+    """
+    base, potencia, bits_por_bloque, datos_bytes = args
+    datos_binarios = bytes_a_binario(datos_bytes)
+    codificador = CodificadorUniversal.get(base, potencia, bits_por_bloque)
+
+    # Codificar (reloj monotónico en nanosegundos)
+    inicio = time.perf_counter_ns()
+    cod = codificador.codificar(datos_binarios)
+    tiempo_cod = (time.perf_counter_ns() - inicio) / 1e9
+
+    # Decodificar
+    inicio = time.perf_counter_ns()
+    dec = codificador.decodificar(cod)
+    tiempo_dec = (time.perf_counter_ns() - inicio) / 1e9
+
+    return cod['num_bloques'], tiempo_cod, tiempo_dec, datos_binarios == dec
+
+
 def ejemplo_2_comparacion_bases():
     """Ejemplo 2: Comparar rendimiento entre Base 2 y Base 5"""
     print("\n" + "="*80)
@@ -73,8 +126,7 @@ def ejemplo_2_comparacion_bases():
     print("="*80)
     
     # Datos de prueba
-    texto = "Análisis comparativo de sistemas de codificación reversible. " * 5
-    datos_bytes = texto.encode('utf-8')
+    datos_bytes = _TEXTO_COMPARACION_BYTES
     datos_binarios = bytes_a_binario(datos_bytes)
     
     print(f"\nDatos de prueba: {len(datos_binarios)} bits")
@@ -89,30 +141,18 @@ def ejemplo_2_comparacion_bases():
     print(f"\n{'Configuración':<30} {'Bloques':<10} {'T.Cod(s)':<12} {'T.Dec(s)':<12} {'OK':<5}")
     print("-" * 80)
     
-    for config in configuraciones:
-        codificador = CodificadorUniversal(
-            base=config['base'],
-            potencia=config['potencia'],
-            bits_por_bloque=config['bits'],
-            verbose=False
-        )
-        
-        # Codificar
-        import time
-        inicio = time.time()
-        cod = codificador.codificar(datos_binarios)
-        tiempo_cod = time.time() - inicio
-        
-        # Decodificar
-        inicio = time.time()
-        dec = codificador.decodificar(cod)
-        tiempo_dec = time.time() - inicio
-        
-        # Verificar
-        ok = datos_binarios == dec
-        
-        print(f"{config['nombre']:<30} {cod['num_bloques']:<10} "
-              f"{tiempo_cod:<12.6f} {tiempo_dec:<12.6f} {'✓' if ok else '✗':<5}")
+    # Cada configuración se procesa en un proceso independiente
+    tareas = [(config['base'], config['potencia'], config['bits'], datos_bytes)
+              for config in configuraciones]
+    with ProcessPoolExecutor(mp_context=_CONTEXTO) as ejecutor:
+        resultados = list(ejecutor.map(_comparar_configuracion, tareas))
+
+    # Una sola escritura para toda la tabla en lugar de un print por fila
+    sys.stdout.write("\n".join(
+        _FILA_CONFIG(config['nombre'], num_bloques,
+                     tiempo_cod, tiempo_dec, '✓' if ok else '✗')
+        for config, (num_bloques, tiempo_cod, tiempo_dec, ok)
+        in zip(configuraciones, resultados)) + "\n")
 
 
 def ejemplo_3_manejo_errores():
@@ -204,6 +244,30 @@ def ejemplo_4_padding_detallado():
               f"{cod['bits_padding']:<10} {'✓' if ok else '✗':<5}")
 
 
+@functools.lru_cache(maxsize=256)
+def _roundtrip_memoizado(datos_binarios, base, potencia, bits_por_bloque):
+    """
+    Ciclo codificar→decodificar memoizado sobre (datos, configuración).
+
+    Los barridos de potencias repiten la misma configuración sobre los
+    mismos datos cuando se encadenan varios ejemplos; la caché elide esos
+    ciclos duplicados.
+
+    Args:
+        datos_binarios: Cadena de bits a codificar
+        base: Base de codificación (2 o 5)
+        potencia: Potencia de la base
+        bits_por_bloque: Tamaño de bloque en bits
+
+    Returns:
+        Tupla (num_bloques, ok)
+    """
+    codificador = CodificadorUniversal.get(base, potencia, bits_por_bloque)
+    cod = codificador.codificar(datos_binarios)
+    dec = codificador.decodificar(cod)
+    return cod['num_bloques'], datos_binarios == dec
+
+
 def ejemplo_5_todas_potencias():
     """Ejemplo 5: Probar todas las potencias permitidas"""
     print("\n" + "="*80)
@@ -211,8 +275,7 @@ def ejemplo_5_todas_potencias():
     print("="*80)
     
     # Datos de prueba
-    texto = "Test de potencias"
-    datos_binarios = bytes_a_binario(texto.encode('utf-8'))
+    datos_binarios = bytes_a_binario(_TEXTO_POTENCIAS_BYTES)
     
     print(f"\nDatos de prueba: {len(datos_binarios)} bits")
     
@@ -227,13 +290,13 @@ def ejemplo_5_todas_potencias():
     print(f"\n{'Potencia (2^n)':<25} {'Valor':<25} {'Bloques':<10} {'Reversible':<12}")
     print("-" * 80)
     
+    # Filas acumuladas y emitidas en una sola escritura
+    filas = []
     for pot, exp in zip(potencias_base2, exponentes_base2):
-        codificador = CodificadorUniversal(base=2, potencia=pot, bits_por_bloque=50, verbose=False)
-        cod = codificador.codificar(datos_binarios)
-        dec = codificador.decodificar(cod)
-        ok = datos_binarios == dec
-        
-        print(f"2^{exp:<22} {pot:<25} {cod['num_bloques']:<10} {'✓ SÍ' if ok else '✗ NO':<12}")
+        num_bloques, ok = _roundtrip_memoizado(datos_binarios, 2, pot, 50)
+        filas.append(_FILA_POTENCIA(2, exp, pot, num_bloques, '✓ SÍ' if ok else '✗ NO'))
+
+    sys.stdout.write("\n".join(filas) + "\n")
     
     # Base 5
     print(f"\n{'─'*80}")
@@ -246,13 +309,12 @@ def ejemplo_5_todas_potencias():
     print(f"\n{'Potencia (5^n)':<25} {'Valor':<25} {'Bloques':<10} {'Reversible':<12}")
     print("-" * 80)
     
+    filas = []
     for pot, exp in zip(potencias_base5, exponentes_base5):
-        codificador = CodificadorUniversal(base=5, potencia=pot, bits_por_bloque=50, verbose=False)
-        cod = codificador.codificar(datos_binarios)
-        dec = codificador.decodificar(cod)
-        ok = datos_binarios == dec
-        
-        print(f"5^{exp:<22} {pot:<25} {cod['num_bloques']:<10} {'✓ SÍ' if ok else '✗ NO':<12}")
+        num_bloques, ok = _roundtrip_memoizado(datos_binarios, 5, pot, 50)
+        filas.append(_FILA_POTENCIA(5, exp, pot, num_bloques, '✓ SÍ' if ok else '✗ NO'))
+
+    sys.stdout.write("\n".join(filas) + "\n")
 
 
 def ejemplo_6_analisis_expansion():
@@ -261,30 +323,38 @@ def ejemplo_6_analisis_expansion():
     print("EJEMPLO 6: Análisis de Tasa de Expansión")
     print("="*80)
     
-    # Datos de prueba de diferentes tamaños
+    # Datos de prueba de diferentes tamaños: un solo buffer maestro del
+    # tamaño máximo, del que cada iteración toma un prefijo
     tamaños = [100, 500, 1000, 5000]
-    
+    maestro = "1" * max(tamaños)
+
+    # Los codificadores no dependen del tamaño: construirlos una sola vez
+    cod2 = CodificadorUniversal.get(2, 256, 100)
+    cod5 = CodificadorUniversal.get(5, 625, 100)
+
     print(f"\n{'Tamaño Original':<20} {'Base':<8} {'Potencia':<12} {'Expansión':<12} {'Eficiencia':<15}")
     print("-" * 80)
-    
+
+    # Filas acumuladas y emitidas en una sola escritura
+    filas = []
     for tamaño in tamaños:
-        datos = "1" * tamaño
-        
+        datos = maestro[:tamaño]
+
         # Base 2
-        cod2 = CodificadorUniversal(base=2, potencia=256, bits_por_bloque=100, verbose=False)
         resultado2 = cod2.codificar(datos)
         metricas2 = AnalizadorEficiencia.calcular_metricas(datos, resultado2)
-        
-        print(f"{tamaño:<20} {'2':<8} {'256':<12} {metricas2['tasa_expansion']:<12.4f} "
-              f"{(1/metricas2['tasa_expansion']*100):<15.2f}%")
-        
+
+        filas.append(_FILA_EXPANSION(tamaño, '2', '256', metricas2['tasa_expansion'],
+                                     1 / metricas2['tasa_expansion'] * 100))
+
         # Base 5
-        cod5 = CodificadorUniversal(base=5, potencia=625, bits_por_bloque=100, verbose=False)
         resultado5 = cod5.codificar(datos)
         metricas5 = AnalizadorEficiencia.calcular_metricas(datos, resultado5)
-        
-        print(f"{tamaño:<20} {'5':<8} {'625':<12} {metricas5['tasa_expansion']:<12.4f} "
-              f"{(1/metricas5['tasa_expansion']*100):<15.2f}%")
+
+        filas.append(_FILA_EXPANSION(tamaño, '5', '625', metricas5['tasa_expansion'],
+                                     1 / metricas5['tasa_expansion'] * 100))
+
+    sys.stdout.write("\n".join(filas) + "\n")
 
 
 def ejemplo_7_verbose_detallado():
@@ -296,8 +366,8 @@ def ejemplo_7_verbose_detallado():
     print("\nEste ejemplo muestra el proceso completo paso a paso.")
     print("Se codificará el texto 'ABC' con Base 5, Potencia 25, bloques de 30 bits")
     
-    texto = "ABC"
-    datos_binarios = bytes_a_binario(texto.encode('utf-8'))
+    texto = _TEXTO_ABC
+    datos_binarios = bytes_a_binario(_TEXTO_ABC_BYTES)
     
     print(f"\nTexto: '{texto}'")
     print(f"Binario: {datos_binarios}")
@@ -323,6 +393,19 @@ def ejemplo_7_verbose_detallado():
     print(f"Coincide: {'✓ SÍ' if texto == texto_reconstruido else '✗ NO'}")
 
 
+# Lista precompilada de ejemplos: el despachador y la opción --only
+# indexan aquí en lugar de reconstruir la lista en cada llamada
+EJEMPLOS = [
+    ejemplo_1_texto_simple,
+    ejemplo_2_comparacion_bases,
+    ejemplo_3_manejo_errores,
+    ejemplo_4_padding_detallado,
+    ejemplo_5_todas_potencias,
+    ejemplo_6_analisis_expansion,
+    ejemplo_7_verbose_detallado
+]
+
+
 def ejecutar_todos_ejemplos():
     """Ejecuta todos los ejemplos en secuencia"""
     print("\n" + "█"*80)
@@ -330,21 +413,11 @@ def ejecutar_todos_ejemplos():
     print("█" + "EJEMPLOS DE USO - CODIFICADOR UNIVERSAL".center(78) + "█")
     print("█" + " "*78 + "█")
     print("█"*80)
-    
-    ejemplos = [
-        ejemplo_1_texto_simple,
-        ejemplo_2_comparacion_bases,
-        ejemplo_3_manejo_errores,
-        ejemplo_4_padding_detallado,
-        ejemplo_5_todas_potencias,
-        ejemplo_6_analisis_expansion,
-        ejemplo_7_verbose_detallado
-    ]
-    
-    for ejemplo in ejemplos:
+
+    for ejemplo in EJEMPLOS:
         ejemplo()
         print()  # Espacio entre ejemplos
-    
+
     print("\n" + "█"*80)
     print("█" + " "*78 + "█")
     print("█" + "TODOS LOS EJEMPLOS COMPLETADOS".center(78) + "█")
@@ -353,4 +426,16 @@ def ejecutar_todos_ejemplos():
 
 
 if __name__ == "__main__":
-    ejecutar_todos_ejemplos()
+    import argparse
+
+    analizador = argparse.ArgumentParser(description="Ejemplos de uso del Codificador Universal")
+    analizador.add_argument(
+        '--only', type=int, choices=range(1, len(EJEMPLOS) + 1), metavar='N',
+        help=f"Ejecutar solo el ejemplo N (1..{len(EJEMPLOS)})"
+    )
+    argumentos = analizador.parse_args()
+
+    if argumentos.only is not None:
+        EJEMPLOS[argumentos.only - 1]()
+    else:
+        ejecutar_todos_ejemplos()
@@ -12,7 +12,26 @@ from codificador_universal import (
     bytes_a_binario,
     binario_a_bytes
 )
+import sys
 import time
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# 'spawn' en lugar de 'fork': el proceso padre ya arrancó los hilos de numba
+# y bifurcarlo después puede dejar a los trabajadores bloqueados
+_CONTEXTO = multiprocessing.get_context('spawn')
+
+# Plantilla de fila precompilada: la especificación de formato se analiza
+# una sola vez en lugar de reconstruirse en cada iteración del barrido
+_FILA_TAMAÑO = "{:<15} {:<10} {:<15.6f} {:<15.6f} {:<12}".format
+
+# Textos de prueba codificados una sola vez a nivel de módulo; los puramente
+# ASCII usan .encode('ascii') (sin despacho de códec utf-8 por llamada) y
+# los que llevan tildes se quedan en utf-8
+_TEXTO_BASE2_BYTES = "Test Base 2".encode('ascii')
+_TEXTO_BASE5_BYTES = "Test Base 5 - Teoría de la información".encode('utf-8')
+_TEXTO_TAMAÑOS_BYTES = ("Análisis de rendimiento con diferentes tamaños de bloque. " * 10).encode('utf-8')
 
 
 def separador(titulo: str):
@@ -22,6 +41,78 @@ def separador(titulo: str):
     print(f"{'█'*80}\n")
 
 
+def _ejecutar_roundtrip(codificador, datos_binarios):
+    """
+    Ejecuta un ciclo codificar→decodificar midiendo cada fase.
+
+    Núcleo común de todos los barridos de configuraciones: los bucles de
+    prueba solo varían parámetros y formato de tabla, así que el trabajo
+    repetido (cronometraje y verificación) vive en un único camino.
+
+    Args:
+        codificador: Instancia de CodificadorUniversal
+        datos_binarios: Cadena de bits a codificar
+
+    Returns:
+        Tupla (datos_codificados, tiempo_cod, tiempo_dec, coincide)
+    """
+    # perf_counter_ns: reloj monotónico de resolución de nanosegundos,
+    # frente a time.time() que puede tener granularidad de milisegundos
+    inicio = time.perf_counter_ns()
+    datos_codificados = codificador.codificar(datos_binarios)
+    tiempo_cod = (time.perf_counter_ns() - inicio) / 1e9
+
+    inicio = time.perf_counter_ns()
+    datos_decodificados = codificador.decodificar(datos_codificados)
+    tiempo_dec = (time.perf_counter_ns() - inicio) / 1e9
+
+    coincide = datos_binarios == datos_decodificados
+    return datos_codificados, tiempo_cod, tiempo_dec, coincide
+
+
+def _ejecutar_configuracion(args):
+    """
+    Trabajador serializable para ProcessPoolExecutor.
+
+    Recibe los bytes crudos (mínimo payload de pickle) y los parámetros de
+    configuración; devuelve solo los números que imprimen las tablas.
+
+    Args:
+        args: Tupla (base, potencia, bits_por_bloque, datos_bytes)
+
+    Returns:
+        Tupla (num_bloques, tiempo_codificacion, tiempo_cod, tiempo_dec, coincide)
+    """
+    base, potencia, bits_por_bloque, datos_bytes = args
+    datos_binarios = bytes_a_binario(datos_bytes)
+    codificador = CodificadorUniversal.get(base, potencia, bits_por_bloque)
+
+    datos_codificados, tiempo_cod, tiempo_dec, coincide = _ejecutar_roundtrip(
+        codificador, datos_binarios)
+
+    return (datos_codificados['num_bloques'], datos_codificados['tiempo_codificacion'],
+            tiempo_cod, tiempo_dec, coincide)
+
+
+def _digest_blake2b(datos) -> bytes:
+    """
+    Digest BLAKE2b de una cadena de bits o de un buffer de bytes.
+
+    Para buffers grandes, comparar digests calculados en código compilado
+    es más barato que la igualdad carácter a carácter de Python, sobre
+    todo cuando el mismo original se compara contra varias configuraciones.
+
+    Args:
+        datos: Cadena de bits ('0'/'1') o bytes
+
+    Returns:
+        Digest binario de 64 bytes
+    """
+    if isinstance(datos, str):
+        datos = datos.encode('ascii')
+    return hashlib.blake2b(datos).digest()
+
+
 def prueba_validacion_parametros():
     """Prueba que las validaciones de parámetros funcionan correctamente"""
     separador("PRUEBA 1: VALIDACIÓN DE PARÁMETROS")
@@ -109,29 +200,22 @@ def prueba_base2_todas_potencias():
     separador("PRUEBA 2: TODAS LAS POTENCIAS DE BASE 2")
     
     potencias = [2, 4, 16, 256, 65536, 4294967296, 18446744073709551616]
-    texto_prueba = "Test Base 2"
-    datos_binarios = bytes_a_binario(texto_prueba.encode('utf-8'))
-    
-    for potencia in potencias:
+    datos_bytes = _TEXTO_BASE2_BYTES
+
+    # Cada potencia es un ensayo independiente: repartirlos entre procesos
+    # y emitir los resultados en el orden original
+    with ProcessPoolExecutor(mp_context=_CONTEXTO) as ejecutor:
+        resultados = list(ejecutor.map(
+            _ejecutar_configuracion,
+            [(2, potencia, 40, datos_bytes) for potencia in potencias]
+        ))
+
+    for potencia, (_, tiempo_codificacion, _, _, coincide) in zip(potencias, resultados):
         print(f"\n{'─'*80}")
         print(f"Probando Base 2, Potencia {potencia} (2^{potencia.bit_length()-1})")
         print(f"{'─'*80}")
-        
-        codificador = CodificadorUniversal(
-            base=2,
-            potencia=potencia,
-            bits_por_bloque=40,
-            verbose=False
-        )
-        
-        # Codificar y decodificar
-        datos_codificados = codificador.codificar(datos_binarios)
-        datos_decodificados = codificador.decodificar(datos_codificados)
-        
-        # Verificar
-        coincide = datos_binarios == datos_decodificados
         print(f"Resultado: {'✓ REVERSIBLE' if coincide else '✗ FALLO'}")
-        print(f"Tiempo codificación: {datos_codificados['tiempo_codificacion']:.6f} seg")
+        print(f"Tiempo codificación: {tiempo_codificacion:.6f} seg")
 
 
 def prueba_base5_todas_potencias():
@@ -139,29 +223,21 @@ def prueba_base5_todas_potencias():
     separador("PRUEBA 3: TODAS LAS POTENCIAS DE BASE 5")
     
     potencias = [5, 25, 125, 625]
-    texto_prueba = "Test Base 5 - Teoría de la información"
-    datos_binarios = bytes_a_binario(texto_prueba.encode('utf-8'))
-    
-    for potencia in potencias:
+    datos_bytes = _TEXTO_BASE5_BYTES
+
+    # Ensayos independientes: mismo esquema de pool que en base 2
+    with ProcessPoolExecutor(mp_context=_CONTEXTO) as ejecutor:
+        resultados = list(ejecutor.map(
+            _ejecutar_configuracion,
+            [(5, potencia, 40, datos_bytes) for potencia in potencias]
+        ))
+
+    for potencia, (_, tiempo_codificacion, _, _, coincide) in zip(potencias, resultados):
         print(f"\n{'─'*80}")
         print(f"Probando Base 5, Potencia {potencia} (5^{len(str(potencia//5))})")
         print(f"{'─'*80}")
-        
-        codificador = CodificadorUniversal(
-            base=5,
-            potencia=potencia,
-            bits_por_bloque=40,
-            verbose=False
-        )
-        
-        # Codificar y decodificar
-        datos_codificados = codificador.codificar(datos_binarios)
-        datos_decodificados = codificador.decodificar(datos_codificados)
-        
-        # Verificar
-        coincide = datos_binarios == datos_decodificados
         print(f"Resultado: {'✓ REVERSIBLE' if coincide else '✗ FALLO'}")
-        print(f"Tiempo codificación: {datos_codificados['tiempo_codificacion']:.6f} seg")
+        print(f"Tiempo codificación: {tiempo_codificacion:.6f} seg")
 
 
 def prueba_diferentes_tamaños_bloque():
@@ -169,37 +245,26 @@ def prueba_diferentes_tamaños_bloque():
     separador("PRUEBA 4: ANÁLISIS DE TAMAÑOS DE BLOQUE")
     
     tamaños = [10, 20, 50, 100, 200, 500, 1000]
-    texto_prueba = "Análisis de rendimiento con diferentes tamaños de bloque. " * 10
-    datos_binarios = bytes_a_binario(texto_prueba.encode('utf-8'))
+    datos_binarios = bytes_a_binario(_TEXTO_TAMAÑOS_BYTES)
     
     print(f"Longitud de datos: {len(datos_binarios)} bits")
     print(f"\n{'Tamaño Bloque':<15} {'Bloques':<10} {'T. Codif.':<15} {'T. Decodif.':<15} {'Reversible':<12}")
     print(f"{'-'*75}")
     
+    # Acumular las filas durante los ciclos medidos y emitirlas en una sola
+    # escritura: ni el flush por línea ni el formateo entran en los tiempos
+    filas = []
     for tamaño in tamaños:
-        codificador = CodificadorUniversal(
-            base=5,
-            potencia=125,
-            bits_por_bloque=tamaño,
-            verbose=False
-        )
-        
-        # Codificar
-        inicio_cod = time.time()
-        datos_codificados = codificador.codificar(datos_binarios)
-        tiempo_cod = time.time() - inicio_cod
-        
-        # Decodificar
-        inicio_dec = time.time()
-        datos_decodificados = codificador.decodificar(datos_codificados)
-        tiempo_dec = time.time() - inicio_dec
-        
-        # Verificar
-        coincide = datos_binarios == datos_decodificados
-        
-        print(f"{tamaño:<15} {datos_codificados['num_bloques']:<10} "
-              f"{tiempo_cod:<15.6f} {tiempo_dec:<15.6f} "
-              f"{'✓ SÍ' if coincide else '✗ NO':<12}")
+        codificador = CodificadorUniversal.get(5, 125, tamaño)
+
+        datos_codificados, tiempo_cod, tiempo_dec, coincide = _ejecutar_roundtrip(
+            codificador, datos_binarios)
+
+        filas.append(_FILA_TAMAÑO(tamaño, datos_codificados['num_bloques'],
+                                  tiempo_cod, tiempo_dec,
+                                  '✓ SÍ' if coincide else '✗ NO'))
+
+    sys.stdout.write("\n".join(filas) + "\n")
 
 
 def prueba_padding():
@@ -248,14 +313,18 @@ def prueba_integridad_imagen():
     
     # Simular datos de imagen (patrón repetitivo de bytes)
     import random
-    random.seed(42)
-    
-    # Crear 1KB de datos "aleatorios"
-    datos_bytes = bytes([random.randint(0, 255) for _ in range(1024)])
+
+    # Crear 1KB de datos "aleatorios": randbytes genera el bloque completo
+    # en código compilado, sin pasar por una lista de enteros
+    datos_bytes = random.Random(42).randbytes(1024)
     datos_binarios = bytes_a_binario(datos_bytes)
     
     print(f"Tamaño de datos simulados: {len(datos_bytes)} bytes ({len(datos_binarios)} bits)")
-    
+
+    # Digest del original calculado una sola vez: cada configuración se
+    # compara contra él sin repetir la igualdad O(N) de Python
+    digest_original = _digest_blake2b(datos_binarios)
+
     configuraciones = [
         {'base': 2, 'potencia': 256, 'bits': 100},
         {'base': 5, 'potencia': 625, 'bits': 100},
@@ -269,19 +338,18 @@ def prueba_integridad_imagen():
               f"{config['bits']} bits/bloque")
         print(f"{'─'*80}")
         
-        codificador = CodificadorUniversal(
-            base=config['base'],
-            potencia=config['potencia'],
-            bits_por_bloque=config['bits'],
-            verbose=False
-        )
+        codificador = CodificadorUniversal.get(config['base'], config['potencia'], config['bits'])
         
         # Codificar
         datos_codificados = codificador.codificar(datos_binarios)
         
         # Decodificar
         datos_decodificados = codificador.decodificar(datos_codificados)
-        
+
+        # Chequeo rápido por digest antes del informe detallado
+        coincide_digest = digest_original == _digest_blake2b(datos_decodificados)
+        print(f"Digest BLAKE2b: {'✓ COINCIDE' if coincide_digest else '✗ NO COINCIDE'}")
+
         # Verificar integridad
         integridad_ok = AnalizadorEficiencia.verificar_integridad(
             datos_binarios,
@@ -299,38 +367,55 @@ def prueba_casos_extremos():
     """Prueba casos extremos y límites del sistema"""
     separador("PRUEBA 7: CASOS EXTREMOS")
     
+    # Los patrones se construyen como bytes ASCII: mitad de memoria que str
+    # y codificar() los acepta directamente desde la entrada normalizada
     print("\nCaso 1: Datos completamente ceros")
-    datos_ceros = "0" * 200
+    datos_ceros = b"0" * 200
     codificador = CodificadorUniversal(base=2, potencia=16, bits_por_bloque=50, verbose=False)
     cod = codificador.codificar(datos_ceros)
     dec = codificador.decodificar(cod)
-    print(f"  Reversible: {'✓ SÍ' if datos_ceros == dec else '✗ NO'}")
-    
+    print(f"  Reversible: {'✓ SÍ' if datos_ceros == dec.encode('ascii') else '✗ NO'}")
+
     print("\nCaso 2: Datos completamente unos")
-    datos_unos = "1" * 200
+    datos_unos = b"1" * 200
     cod = codificador.codificar(datos_unos)
     dec = codificador.decodificar(cod)
-    print(f"  Reversible: {'✓ SÍ' if datos_unos == dec else '✗ NO'}")
-    
+    print(f"  Reversible: {'✓ SÍ' if datos_unos == dec.encode('ascii') else '✗ NO'}")
+
     print("\nCaso 3: Datos alternados")
-    datos_alternados = "10" * 100
+    datos_alternados = b"10" * 100
     cod = codificador.codificar(datos_alternados)
     dec = codificador.decodificar(cod)
-    print(f"  Reversible: {'✓ SÍ' if datos_alternados == dec else '✗ NO'}")
-    
+    print(f"  Reversible: {'✓ SÍ' if datos_alternados == dec.encode('ascii') else '✗ NO'}")
+
     print("\nCaso 4: Un solo bit")
-    datos_un_bit = "1"
+    datos_un_bit = b"1"
     codificador_min = CodificadorUniversal(base=5, potencia=5, bits_por_bloque=10, verbose=False)
     cod = codificador_min.codificar(datos_un_bit)
     dec = codificador_min.decodificar(cod)
-    print(f"  Reversible: {'✓ SÍ' if datos_un_bit == dec else '✗ NO'}")
-    
+    print(f"  Reversible: {'✓ SÍ' if datos_un_bit == dec.encode('ascii') else '✗ NO'}")
+
     print("\nCaso 5: Tamaño máximo de bloque (1000 bits)")
-    datos_grandes = "1" * 5000
+    datos_grandes = b"1" * 5000
     codificador_max = CodificadorUniversal(base=2, potencia=256, bits_por_bloque=1000, verbose=False)
     cod = codificador_max.codificar(datos_grandes)
     dec = codificador_max.decodificar(cod)
-    print(f"  Reversible: {'✓ SÍ' if datos_grandes == dec else '✗ NO'}")
+    # Buffer grande: comparar digests en lugar de la igualdad byte a byte
+    reversible = _digest_blake2b(datos_grandes) == _digest_blake2b(dec)
+    print(f"  Reversible: {'✓ SÍ' if reversible else '✗ NO'}")
+
+
+# Lista precompilada de pruebas: el despachador y la opción --only
+# indexan aquí en lugar de enumerar las llamadas a mano
+PRUEBAS = [
+    prueba_validacion_parametros,
+    prueba_base2_todas_potencias,
+    prueba_base5_todas_potencias,
+    prueba_diferentes_tamaños_bloque,
+    prueba_padding,
+    prueba_integridad_imagen,
+    prueba_casos_extremos
+]
 
 
 def ejecutar_todas_pruebas():
@@ -340,20 +425,15 @@ def ejecutar_todas_pruebas():
     print("█" + "  SUITE COMPLETA DE PRUEBAS - CODIFICADOR UNIVERSAL".center(78) + "█")
     print("█" + " "*78 + "█")
     print("█"*80)
-    
-    inicio_total = time.time()
-    
+
+    inicio_total = time.perf_counter_ns()
+
     # Ejecutar todas las pruebas
-    prueba_validacion_parametros()
-    prueba_base2_todas_potencias()
-    prueba_base5_todas_potencias()
-    prueba_diferentes_tamaños_bloque()
-    prueba_padding()
-    prueba_integridad_imagen()
-    prueba_casos_extremos()
-    
-    tiempo_total = time.time() - inicio_total
-    
+    for prueba in PRUEBAS:
+        prueba()
+
+    tiempo_total = (time.perf_counter_ns() - inicio_total) / 1e9
+
     separador("RESUMEN FINAL")
     print(f"Todas las pruebas completadas exitosamente")
     print(f"Tiempo total de ejecución: {tiempo_total:.2f} segundos")
@@ -361,4 +441,16 @@ def ejecutar_todas_pruebas():
 
 
 if __name__ == "__main__":
-    ejecutar_todas_pruebas()
+    import argparse
+
+    analizador = argparse.ArgumentParser(description="Suite de pruebas del Codificador Universal")
+    analizador.add_argument(
+        '--only', type=int, choices=range(1, len(PRUEBAS) + 1), metavar='N',
+        help=f"Ejecutar solo la prueba N (1..{len(PRUEBAS)})"
+    )
+    argumentos = analizador.parse_args()
+
+    if argumentos.only is not None:
+        PRUEBAS[argumentos.only - 1]()
+    else:
+        ejecutar_todas_pruebas()